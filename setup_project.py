@@ -7,70 +7,160 @@ This script replaces template variables with actual values and sets up a new pro
 
 import os
 import re
-import shutil
+import string
 import sys
-from email.utils import parseaddr
+from functools import partial
 from pathlib import Path
 
+# Template root and the placeholder package inside it
+_HERE = Path(__file__).resolve().parent
+_TEMPLATE_SRC = _HERE / "src" / "{{MODULE_NAME}}"
+
+# Compiled once at import time; these are matched repeatedly in the input loops
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_PEP508_RE = re.compile(r"^[a-zA-Z0-9]([a-zA-Z0-9._-]*[a-zA-Z0-9])?$")
+
+# File extensions whose contents may hold template variables
+_SUFFIXES = (".py", ".md", ".txt", ".toml", ".yml", ".yaml")
+
+# Names skipped when copying the template into a new project
+_COPY_IGNORE = frozenset(
+    {"setup_project.py", "test_setup_project.py", ".git", "__pycache__"}
+)
+
+# Maps every non-alphanumeric character to "_" when deriving the module name
+_MOD_TABLE = str.maketrans(
+    {c: "_" for c in map(chr, range(256)) if not (c.isascii() and c.isalnum())}
+)
+
 
 def is_valid_email(email: str) -> bool:
     """
-    Validate email address format using basic regex and parseaddr.
-    This follows RFC 5322 standards more closely than simple regex.
+    Validate email address format using a basic regex.
+    This covers the plain addr-spec form expected for package metadata.
     """
-    if not email or "@" not in email:
-        return False
+    return bool(_EMAIL_RE.fullmatch(email))
+
 
-    # Use parseaddr to parse the email
-    parsed_name, parsed_email = parseaddr(email)
+def compile_replacements(replacements: dict) -> re.Pattern:
+    """Compile the template variables into a single alternation pattern."""
+    if not replacements:
+        # An empty alternation would match at every position
+        raise ValueError("No template variables to compile")
+    keys = list(replacements)
+    separator = b"|" if isinstance(keys[0], bytes) else "|"
+    return re.compile(separator.join(re.escape(k) for k in keys))
 
-    # Basic validation: must have @ symbol and valid structure
-    if not parsed_email or "@" not in parsed_email:
-        return False
 
-    # Basic regex for email validation (simplified but covers most cases)
-    email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
+def encode_replacements(replacements: dict) -> dict:
+    """Encode template variables and values to UTF-8 for byte-level rewriting."""
+    return {k.encode("utf-8"): v.encode("utf-8") for k, v in replacements.items()}
 
-    return bool(re.match(email_pattern, parsed_email))
 
+def make_substitute(replacements: dict, pattern: re.Pattern | None = None):
+    """Specialize pattern.sub for a fixed replacements dict."""
+    if pattern is None:
+        pattern = compile_replacements(replacements)
+    lookup = replacements.__getitem__
 
-def replace_in_file(file_path: Path, replacements: dict):
-    """Replace template variables in a file."""
+    def repl(m):
+        return lookup(m[0])
+
+    return partial(pattern.sub, repl)
+
+
+def replace_in_file(file_path: Path, substitute):
+    """
+    Replace template variables in a file in a single pass.
+
+    Substitution runs on raw bytes, so no decode/encode round-trip is needed.
+    Build ``substitute`` once with make_substitute(encode_replacements(...))
+    and reuse it for every file.
+    """
     try:
-        content = file_path.read_text(encoding="utf-8")
-        for template_var, replacement in replacements.items():
-            content = content.replace(template_var, replacement)
-        file_path.write_text(content, encoding="utf-8")
+        raw = file_path.read_bytes()
+        # Cheap byte scan first: most files contain no template markers at all
+        if b"{{" not in raw:
+            return
+        new_raw = substitute(raw)
+        if new_raw != raw:
+            file_path.write_bytes(new_raw)
     except Exception as e:
         print(f"Warning: Could not process {file_path}: {e}")
 
 
-def rename_paths(base_path: Path, replacements: dict):
+def rename_paths(
+    base_path: Path, replacements: dict, pattern: re.Pattern | None = None
+):
     """Rename files and directories that contain template variables."""
+    if not replacements:
+        return
+    substitute = make_substitute(replacements, pattern)
     for root, dirs, files in os.walk(base_path, topdown=False):
-        root_path = Path(root)
+        # Rename files, then directories once their contents are done
+        for name in files + dirs:
+            if "{{" not in name:
+                continue
+            new_name = substitute(name)
+            if new_name != name:
+                os.replace(os.path.join(root, name), os.path.join(root, new_name))
+
+
+def copy_template(
+    src_dir: Path,
+    dst_dir: Path,
+    replacements: dict | None = None,
+    pattern: re.Pattern | None = None,
+    ignore=_COPY_IGNORE,
+):
+    """
+    Copy the template tree, copying files in parallel.
+
+    When replacements are given, names are rewritten while copying. Returns a
+    list of (destination path, needs_rewrite) tuples for every copied file.
+    """
+    import shutil
+    from concurrent.futures import ThreadPoolExecutor
+
+    substitute = make_substitute(replacements, pattern) if replacements else None
+
+    # Snapshot the tree before writing anything, so a target inside the
+    # template is never scanned while it is being filled
+    dirs = [str(dst_dir)]
+    files = []
+    stack = [(str(src_dir), str(dst_dir))]
+    while stack:
+        src, dst = stack.pop()
+        with os.scandir(src) as it:
+            for entry in it:
+                name = entry.name
+                if name in ignore:
+                    continue
+                if substitute is not None and "{{" in name:
+                    name = substitute(name)
+                target = os.path.join(dst, name)
+                if entry.is_dir():
+                    dirs.append(target)
+                    stack.append((entry.path, target))
+                else:
+                    files.append((entry.path, target))
+
+    # Create directories up front so worker threads never race on mkdir
+    for path in dirs:
+        os.makedirs(path, exist_ok=True)
 
-        # Rename files
-        for file in files:
-            old_file_path = root_path / file
-            new_file_name = file
-            for template_var, replacement in replacements.items():
-                new_file_name = new_file_name.replace(template_var, replacement)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for future in [pool.submit(shutil.copy2, src, dst) for src, dst in files]:
+            future.result()
 
-            if new_file_name != file:
-                new_file_path = root_path / new_file_name
-                old_file_path.rename(new_file_path)
+    return [(dst, dst.endswith(_SUFFIXES)) for _src, dst in files]
 
-        # Rename directories
-        for dir_name in dirs:
-            old_dir_path = root_path / dir_name
-            new_dir_name = dir_name
-            for template_var, replacement in replacements.items():
-                new_dir_name = new_dir_name.replace(template_var, replacement)
 
-            if new_dir_name != dir_name:
-                new_dir_path = root_path / new_dir_name
-                old_dir_path.rename(new_dir_path)
+def _finish_cleanup(cleanup, old_venv: Path):
+    """Wait for a background venv removal and warn if anything was left."""
+    cleanup.join()
+    if old_venv.exists():
+        print(f"⚠️  Could not fully remove {old_venv}, delete it manually")
 
 
 def setup_project():
@@ -86,9 +176,7 @@ def setup_project():
             continue
 
         # Validate PEP 508 identifier (letters, digits, hyphens, periods, underscores)
-        if not re.match(
-            r"^[a-zA-Z0-9][a-zA-Z0-9._-]*[a-zA-Z0-9]$|^[a-zA-Z0-9]$", project_name
-        ):
+        if not _PEP508_RE.match(project_name):
             print("❌ Project name must be a valid PEP 508 identifier:")
             print("   - Start and end with letters/digits")
             print(
@@ -99,8 +187,9 @@ def setup_project():
         break
 
     # Derive module name from project name
-    module_name = re.sub(r"[^a-zA-Z0-9]", "_", project_name).lower()
-    module_name = re.sub(r"_+", "_", module_name).strip("_")
+    module_name = "_".join(
+        filter(None, project_name.lower().translate(_MOD_TABLE).split("_"))
+    )
 
     project_description = input("Project description: ").strip()
     if not project_description:
@@ -128,9 +217,7 @@ def setup_project():
         github_username = "yourusername"
 
     # Derive main class name
-    main_class = "".join(word.capitalize() for word in module_name.split("_"))
-    if not main_class:
-        main_class = "MainClass"
+    main_class = string.capwords(module_name, "_").replace("_", "") or "MainClass"
 
     # Create replacements dictionary
     replacements = {
@@ -142,15 +229,18 @@ def setup_project():
         "{{GITHUB_USERNAME}}": github_username,
         "{{MAIN_CLASS}}": main_class,
     }
+    pattern = compile_replacements(replacements)
+    rewrite = make_substitute(encode_replacements(replacements))
 
     # Ensure the src/module_name directory is created, not a nested project
     def fix_src_layout(target_dir, module_name):
+        import shutil
+
         src_dir = target_dir / "src"
-        template_src = Path(__file__).parent / "src" / "{{MODULE_NAME}}"
         new_module_dir = src_dir / module_name
         if not new_module_dir.exists():
             new_module_dir.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copytree(template_src, new_module_dir)
+            shutil.copytree(_TEMPLATE_SRC, new_module_dir)
             # Remove the old template module dir if it exists
             old_template_dir = src_dir / "{{MODULE_NAME}}"
             if old_template_dir.exists():
@@ -179,8 +269,9 @@ def setup_project():
     else:
         target_dir = Path(target_dir_input)
 
-    # Prevent accidental overwrite in current directory
-    if target_dir.resolve() == Path(".").resolve():
+    # Prevent accidental overwrite in current directory (cwd is already
+    # absolute, so only the target needs resolving)
+    if target_dir.resolve() == Path.cwd():
         print("⚠️  You are about to run the template setup in the current directory!")
         print("   This may overwrite template files and is NOT recommended.")
         confirm_current = (
@@ -203,33 +294,20 @@ def setup_project():
     elif not target_dir.exists():
         target_dir.mkdir(parents=True)
 
-    # Copy template to target directory (skip if current directory)
-    template_dir = Path(__file__).parent
-    if target_dir.resolve() != template_dir.resolve():
-        print(f"\n📋 Copying template to {target_dir}...")
-        shutil.copytree(
-            template_dir,
-            target_dir,
-            dirs_exist_ok=True,
-            ignore=shutil.ignore_patterns("setup_project.py", ".git", "__pycache__"),
-        )
-    else:
-        print("\n📋 Using current directory as project root...")
+    # Copy template to target directory, renaming paths as they are copied.
+    # The target is always a new, empty directory: the template itself is
+    # never empty, so an in-place setup is rejected by the check above.
+    print(f"\n📋 Copying template to {target_dir}...")
+    pending = copy_template(_HERE, target_dir, replacements, pattern)
 
     # Fix src layout to avoid nested project directories
     fix_src_layout(target_dir, module_name)
 
-    # Rename paths first
-    print("🔧 Renaming files and directories...")
-    rename_paths(target_dir, replacements)
-
-    # Replace template variables in all files
+    # Paths were already renamed while copying; only contents remain
     print("📝 Replacing template variables...")
-    for root, _dirs, files in os.walk(target_dir):
-        for file in files:
-            file_path = Path(root) / file
-            if file_path.suffix in [".py", ".md", ".txt", ".toml", ".yml", ".yaml"]:
-                replace_in_file(file_path, replacements)
+    for file_path, needs_rewrite in pending:
+        if needs_rewrite:
+            replace_in_file(Path(file_path), rewrite)
 
     print(f"\n🎉 Project {project_name} created successfully!")
     print(f"📁 Location: {target_dir.absolute()}")
@@ -242,20 +320,30 @@ def setup_project():
     )
     if setup_venv in ["", "y", "yes"]:
         print("\n🔧 Setting up virtual environment...")
+        import shutil
         import subprocess
-        import time
+        import threading
 
+        old_venv = cleanup = None
         try:
             # Always create a new venv in the target directory, removing any existing one
             venv_path = target_dir / "venv"
             if venv_path.exists():
                 print("   Removing existing venv...")
-                shutil.rmtree(venv_path)
+                # Move it aside and delete it in the background so the new
+                # venv can be created straight away
+                old_venv = venv_path.with_name("venv.old." + os.urandom(4).hex())
+                venv_path.rename(old_venv)
+                cleanup = threading.Thread(
+                    target=shutil.rmtree,
+                    args=(old_venv,),
+                    kwargs={"ignore_errors": True},
+                )
+                cleanup.start()
             print("   Creating virtual environment...")
             subprocess.run(
                 [sys.executable, "-m", "venv", "venv"], cwd=target_dir, check=True
             )
-            time.sleep(1)
             # Determine the python executable in the venv
             if sys.platform == "win32":
                 venv_python = target_dir / "venv" / "Scripts" / "python.exe"
@@ -280,6 +368,9 @@ def setup_project():
                 cwd=target_dir,
                 check=True,
             )
+            if cleanup is not None:
+                _finish_cleanup(cleanup, old_venv)
+                cleanup = None
             print("✅ Virtual environment setup complete!")
             # Test hello world functionality
             test_hello = input("\n🧪 Run Hello World test? (Y/n): ").strip().lower()
@@ -314,6 +405,10 @@ def setup_project():
         except Exception as e:
             print(f"❌ Unexpected error: {e}")
             print("Please set up the environment manually.")
+        finally:
+            # Still wait for the old venv removal when setup failed part-way
+            if cleanup is not None:
+                _finish_cleanup(cleanup, old_venv)
     else:
         print("\n🚀 Manual setup steps:")
         print(f"   cd {target_dir}")
@@ -0,0 +1,182 @@
+"""Tests for the template setup script."""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+import setup_project
+
+REPLACEMENTS = {
+    "{{PROJECT_NAME}}": "my-project",
+    "{{MODULE_NAME}}": "my_project",
+}
+
+
+def make_template(root):
+    """Create a small template tree with placeholders and ignored entries."""
+    module_dir = root / "src" / "{{MODULE_NAME}}"
+    module_dir.mkdir(parents=True)
+    (module_dir / "__init__.py").write_text('"""{{PROJECT_NAME}}."""\n')
+    (module_dir / "py.typed").write_text("")
+    (module_dir / "__pycache__").mkdir()
+    (module_dir / "__pycache__" / "core.cpython-310.pyc").write_bytes(b"\0")
+    (root / "tests").mkdir()
+    (root / "tests" / "test_{{MODULE_NAME}}.py").write_text("import {{MODULE_NAME}}\n")
+    (root / "README.md").write_text("# {{PROJECT_NAME}}\n")
+    (root / "LICENSE").write_text("MIT\n")
+    (root / "setup_project.py").write_text("# setup\n")
+
+
+def snapshot(root):
+    """Map each file's relative path to its contents."""
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in root.rglob("*")
+        if path.is_file()
+    }
+
+
+def make_rewrite(replacements):
+    """Build the bytes substitute callable used by replace_in_file."""
+    return setup_project.make_substitute(
+        setup_project.encode_replacements(replacements)
+    )
+
+
+class TestCompileReplacements:
+    """Test compiling template variables into a pattern."""
+
+    def test_empty_replacements_raise(self):
+        """Test an empty dict is rejected rather than matching everywhere."""
+        with pytest.raises(ValueError):
+            setup_project.compile_replacements({})
+
+    def test_bytes_keys_give_bytes_pattern(self):
+        """Test bytes-keyed replacements compile to a bytes pattern."""
+        pattern = setup_project.compile_replacements(
+            setup_project.encode_replacements(REPLACEMENTS)
+        )
+        assert isinstance(pattern.pattern, bytes)
+        assert pattern.findall(b"{{MODULE_NAME}}.{{PROJECT_NAME}}") == [
+            b"{{MODULE_NAME}}",
+            b"{{PROJECT_NAME}}",
+        ]
+
+
+class TestMakeSubstitute:
+    """Test the specialized substitution callable."""
+
+    def test_substitutes_str(self):
+        """Test every template variable is replaced in a str."""
+        substitute = setup_project.make_substitute(REPLACEMENTS)
+        result = substitute("{{PROJECT_NAME}}/{{MODULE_NAME}}")
+        assert result == "my-project/my_project"
+
+    def test_substitutes_encoded_values(self):
+        """Test non-ASCII and empty values survive encode_replacements."""
+        substitute = make_rewrite({"{{AUTHOR_NAME}}": "José", "{{EMPTY}}": ""})
+        assert substitute(b"by {{AUTHOR_NAME}}{{EMPTY}}!") == "by José!".encode()
+
+    def test_leaves_unknown_markers(self):
+        """Test markers that are not template variables are left alone."""
+        substitute = setup_project.make_substitute(REPLACEMENTS)
+        assert substitute("{{OTHER}}") == "{{OTHER}}"
+
+
+class TestReplaceInFile:
+    """Test rewriting template variables in a file."""
+
+    def test_writes_replaced_bytes(self, tmp_path):
+        """Test the file is rewritten with UTF-8 encoded values."""
+        path = tmp_path / "README.md"
+        content = "# {{PROJECT_NAME}} – {{AUTHOR_NAME}}{{EMPTY}}\r\n"
+        path.write_bytes(content.encode())
+        rewrite = make_rewrite(
+            {
+                "{{PROJECT_NAME}}": "my-project",
+                "{{AUTHOR_NAME}}": "José",
+                "{{EMPTY}}": "",
+            }
+        )
+
+        setup_project.replace_in_file(path, rewrite)
+
+        assert path.read_bytes() == "# my-project – José\r\n".encode()
+
+    @pytest.mark.parametrize("content", [b"no markers here\n", b"{{OTHER}}\n"])
+    def test_unchanged_file_is_not_written(self, tmp_path, content):
+        """Test a file with nothing to replace keeps its contents and mtime."""
+        path = tmp_path / "LICENSE.txt"
+        path.write_bytes(content)
+        os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+
+        setup_project.replace_in_file(path, make_rewrite(REPLACEMENTS))
+
+        assert path.read_bytes() == content
+        assert path.stat().st_mtime_ns == 1_000_000_000
+
+
+class TestRenamePaths:
+    """Test renaming paths that contain template variables."""
+
+    def test_renames_files_and_directories(self, tmp_path):
+        """Test template variables in names are replaced."""
+        make_template(tmp_path)
+
+        setup_project.rename_paths(tmp_path, REPLACEMENTS)
+
+        assert (tmp_path / "src" / "my_project" / "__init__.py").is_file()
+        assert (tmp_path / "tests" / "test_my_project.py").is_file()
+
+    def test_empty_replacements_are_a_no_op(self, tmp_path):
+        """Test an empty dict leaves every path untouched."""
+        make_template(tmp_path)
+        before = snapshot(tmp_path)
+
+        setup_project.rename_paths(tmp_path, {})
+
+        assert snapshot(tmp_path) == before
+
+
+class TestCopyTemplate:
+    """Test copying the template into a new project."""
+
+    def test_matches_copytree_and_rename_paths(self, tmp_path):
+        """Test output matches shutil.copytree followed by rename_paths."""
+        template = tmp_path / "template"
+        make_template(template)
+
+        expected = tmp_path / "expected"
+        shutil.copytree(
+            template,
+            expected,
+            ignore=shutil.ignore_patterns("setup_project.py", ".git", "__pycache__"),
+        )
+        setup_project.rename_paths(expected, REPLACEMENTS)
+
+        actual = tmp_path / "actual"
+        setup_project.copy_template(template, actual, REPLACEMENTS)
+
+        assert snapshot(actual) == snapshot(expected)
+        assert not (actual / "src" / "my_project" / "__pycache__").exists()
+
+    def test_returns_pending_rewrites(self, tmp_path):
+        """Test the returned list flags only files whose contents need rewriting."""
+        template = tmp_path / "template"
+        make_template(template)
+        target = tmp_path / "target"
+
+        pending = setup_project.copy_template(template, target, REPLACEMENTS)
+
+        assert sorted(
+            (Path(path).relative_to(target).as_posix(), needs_rewrite)
+            for path, needs_rewrite in pending
+        ) == [
+            ("LICENSE", False),
+            ("README.md", True),
+            ("src/my_project/__init__.py", True),
+            ("src/my_project/py.typed", False),
+            ("tests/test_my_project.py", True),
+        ]